@@ -17,17 +17,12 @@ Env (suggested):
   BG_STIPPLE=gray50             # gray12..gray75 (more = darker)
 """
 
-import json, math, os, random, re, socket, threading, time
+import array, ctypes, functools, hashlib, heapq, json, math, os, random, re, select, socket, struct, sys, threading, time
 from datetime import datetime
 from typing import Optional, Tuple
 import tkinter as tk
-from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
-try:
-    import requests
-except Exception:
-    requests = None
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from tkinter import ttk
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
@@ -39,8 +34,11 @@ CONFIG = {
     "api_host": os.environ.get("MINER_API_HOST", "127.0.0.1"),
     "api_port": int(os.environ.get("MINER_API_PORT", "4028")),
     "ui_refresh_s": 1,
+    "ui_max_fps": 30,
     "miner_refresh_s": 1,
     "network_refresh_s": 120,
+    "difficulty_refresh_s": 3600,
+    "sensors_refresh_s": 2,
     "fullscreen": os.environ.get("FULLSCREEN", "1") == "1",
     "api_difficulty": os.environ.get("API_DIFFICULTY", "https://blockchain.info/q/getdifficulty"),
     "api_height": os.environ.get("API_HEIGHT", "https://mempool.space/api/blocks/tip/height"),
@@ -56,17 +54,22 @@ CONFIG = {
     #"bg_image": os.environ.get("BG_IMAGE", "/home/pi-miner/piminer/bitcoin_bg.png"),  # PNG/GIF (no JPG)
     "bg_image": os.environ.get("BG_IMAGE", os.path.join(APP_DIR, "bitcoin_bg.png")),
     "bg_stipple": os.environ.get("BG_STIPPLE", "gray50"),  # gray12..gray75 (more = darker)
+    "cache_dir": os.environ.get("CACHE_DIR", os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "piminer")),
 }
 
 def S(px: int) -> int:
     return int(round(px * CONFIG["ui_scale"]))
 
 # --------------- Utils ------------------
+_UNITS = ("H/s","KH/s","MH/s","GH/s","TH/s","PH/s","EH/s")
+_POW = (1.0, 1e3, 1e6, 1e9, 1e12, 1e15, 1e18)
+
 def human_hashrate(hps: float) -> str:
-    units = ["H/s","KH/s","MH/s","GH/s","TH/s","PH/s","EH/s"]
-    v=hps; i=0
-    while v>=1000 and i<len(units)-1: v/=1000; i+=1
-    return (f"{v:.2f}" if v<10 else f"{v:.1f}" if v<100 else f"{v:.0f}") + " " + units[i]
+    # pick the unit from the decimal exponent instead of dividing in a loop
+    i = 0 if not hps >= 1000 else 6 if hps >= 1e18 else int(math.log10(hps)//3)
+    v = hps * (1.0/_POW[i])
+    return (f"{v:.2f}" if v<10 else f"{v:.1f}" if v<100 else f"{v:.0f}") + " " + _UNITS[i]
 
 def human_duration(seconds: float) -> str:
     if not seconds or not math.isfinite(seconds):
@@ -109,33 +112,139 @@ def fmt_prob_human(p: float) -> str:
     else:
         return _fmt_one_in(inv)
 
+# The UI re-formats the same ET/odds every tick; cache on quantized inputs.
+_human_duration_cached = functools.lru_cache(maxsize=256)(human_duration)
+
+def human_duration_q(seconds: float) -> str:
+    """human_duration with seconds rounded (to the minute past 1h) and memoized."""
+    if not seconds or not math.isfinite(seconds): return human_duration(seconds)
+    return _human_duration_cached(int(round(seconds/60.0))*60 if seconds >= 3600 else int(round(seconds)))
+
+@functools.lru_cache(maxsize=256)
+def _fmt_prob_key(pct_h: Optional[int], n: float) -> str:
+    one_in = _fmt_one_in(n)
+    if pct_h is None: return one_in
+    return f"{'100%' if pct_h >= 10000 else f'{pct_h / 100:.2f}%'} ({one_in})"
+
+def fmt_prob_human_q(p: float) -> str:
+    """fmt_prob_human memoized on exactly what it displays: hundredths of a
+    percent and N (whole below 1e6, else 3 significant figures)."""
+    if p is None or not math.isfinite(p) or p <= 0: return "—"
+    inv = 1.0 / p
+    n = round(inv) if inv < 1e6 else float(f"{inv:.2e}")
+    return _fmt_prob_key(round(p * 1e4) if p >= 1e-4 else None, n)
+
+def load_logo_image(path: str, target: int):
+    """Open path fitted within target x target px, reusing a resized copy cached on disk."""
+    from PIL import Image  # deferred: only needed for the logo
+    stem = os.path.splitext(os.path.basename(path))[0]
+    key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:8]  # same name, other dir
+    cache_path = os.path.join(CONFIG["cache_dir"], f"{stem}_{key}_{target}.png")
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            cached = Image.open(cache_path); cached.load()  # decode now: a bad cache falls back
+            return cached
+    except Exception:
+        pass
+    pil = Image.open(path)
+    # BILINEAR is indistinguishable from LANCZOS at icon size and much cheaper
+    pil.thumbnail((target, target), getattr(Image, "Resampling", Image).BILINEAR)
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CONFIG["cache_dir"], exist_ok=True)
+        pil.save(tmp, format="PNG", optimize=True)
+        os.replace(tmp, cache_path)  # atomic: a crash mid-save never leaves a truncated cache
+    except Exception:
+        try: os.unlink(tmp)
+        except OSError: pass  # cache is best-effort
+    return pil
+
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+_TEMP_FD = None  # kept open; sysfs re-reads the current value at offset 0
+
 def read_cpu_temp_c() -> Optional[float]:
+    global _TEMP_FD
     try:
-        with open("/sys/class/thermal/thermal_zone0/temp","r") as f:
-            return int(f.read().strip())/1000.0
+        if _TEMP_FD is None:
+            _TEMP_FD = os.open(THERMAL_PATH, os.O_RDONLY | os.O_CLOEXEC)
+        return int(os.pread(_TEMP_FD, 32, 0).strip())/1000.0
     except Exception:
+        if _TEMP_FD is not None:
+            try: os.close(_TEMP_FD)
+            except OSError: pass
+            _TEMP_FD = None
         return None
 
 # -------------- BFGMiner API ---------------
-def query_cgminer_api(host: str, port: int, cmd: str = "summary", timeout: float = 1.0) -> Optional[dict]:
-    try:
-        with socket.create_connection((host, port), timeout=timeout) as s:
-            s.sendall(cmd.encode("ascii")); data = s.recv(65535)
-        raw = data.decode("utf-8", errors="ignore")
+_KV_SEP = str.maketrans("|", ",")
+
+def _parse_json(raw: str) -> Optional[dict]:
+    return json.loads(raw[raw.find("{"): raw.rfind("}") + 1])
+
+def _parse_kv(raw: str) -> Optional[dict]:
+    result={}
+    for part in raw.translate(_KV_SEP).split(","):
+        if "=" in part:
+            k,v=part.split("=",1); result[k.strip()]=v.strip()
+    return result or None
+
+class CgminerClient:
+    """cgminer/BFGMiner API client.
+
+    The API closes the socket after every reply, so each query reconnects;
+    the JSON-vs-key=value reply format is detected once and reused.
+    """
+    def __init__(self, host: str, port: int, budget_s: float = 0.1):
+        self.host = host
+        self.port = port
+        self.budget_s = budget_s
+        self._parse = None  # _parse_json or _parse_kv once detected
+
+    def _recv_all(self, s: socket.socket, deadline: float) -> bytes:
+        chunks = []
+        while True:
+            left = deadline - time.monotonic()
+            if left <= 0 or not select.select([s], [], [], left)[0]:
+                break
+            try:
+                chunk = s.recv(65535)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                break  # server closed: reply complete
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def query(self, cmd: str = "summary") -> Optional[dict]:
+        deadline = time.monotonic() + self.budget_s
+        try:
+            with socket.create_connection((self.host, self.port), timeout=self.budget_s) as s:
+                s.sendall(cmd.encode("ascii"))
+                s.setblocking(False)
+                raw = self._recv_all(s, deadline).decode("utf-8", errors="ignore")
+        except Exception:
+            return None
+        if not raw:
+            return None
+        if self._parse is not None:
+            try:
+                result = self._parse(raw)
+                if result: return result
+            except Exception: pass
+            self._parse = None  # format changed; detect again
         if "{" in raw and "}" in raw:
-            jtxt = raw[raw.find("{"): raw.rfind("}") + 1]
-            try: return json.loads(jtxt)
+            try:
+                result = _parse_json(raw); self._parse = _parse_json
+                return result
             except Exception: pass
-        result={}
-        for part in raw.replace("|", ",").split(","):
-            if "=" in part:
-                k,v=part.split("=",1); result[k.strip()]=v.strip()
-        return result or None
-    except Exception:
-        return None
+        result = _parse_kv(raw)
+        if result: self._parse = _parse_kv
+        return result
+
+CGMINER = CgminerClient(CONFIG["api_host"], CONFIG["api_port"])
 
 def get_bfgminer_hashrate_hps() -> Tuple[float, str]:
-    resp = query_cgminer_api(CONFIG["api_host"], CONFIG["api_port"], "summary")
+    resp = CGMINER.query("summary")
     if resp:
         for key in ("MHS av","MHS 5s","MHS 1m","MHS 5m","MHS 15m","GHS av","KHS 5s","KHS av"):
             if key in resp:
@@ -147,11 +256,48 @@ def get_bfgminer_hashrate_hps() -> Tuple[float, str]:
         if "GHS" in resp: return float(resp["GHS"])*1e9, "BFGMiner API"
     return 0.0, "BFGMiner API (no data)"
 
+# -------------- inotify (Linux) -----------
+IN_MODIFY, IN_DELETE_SELF, IN_MOVE_SELF = 0x002, 0x400, 0x800
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (+ name)
+_libc = None
+
+def inotify_watch(path: str, mask: int) -> int:
+    """Return a non-blocking inotify fd watching path, or -1 if unavailable."""
+    global _libc
+    if not sys.platform.startswith("linux"): return -1
+    try:
+        if _libc is None: _libc = ctypes.CDLL(None, use_errno=True)
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)  # IN_NONBLOCK|IN_CLOEXEC
+        if fd < 0: return -1
+        if _libc.inotify_add_watch(fd, os.fsencode(path), mask) < 0:
+            os.close(fd); return -1
+        return fd
+    except Exception:
+        return -1
+
+def inotify_read_mask(fd: int) -> int:
+    """Drain pending inotify events and return their OR-ed masks."""
+    mask = 0
+    while True:
+        try: buf = os.read(fd, 4096)
+        except BlockingIOError: break
+        if not buf: break
+        off = 0
+        while off + _INOTIFY_EVENT.size <= len(buf):
+            _, m, _, n = _INOTIFY_EVENT.unpack_from(buf, off)
+            mask |= m; off += _INOTIFY_EVENT.size + n
+    return mask
+
 # -------------- cpuminer tail --------------
-CPUMINER_RATE_RE = re.compile(r"(?:thread\s+\d+:\s+)?[\d,]+\s+hashes,\s*([\d.]+)\s*(khash/s|Mhash/s|kH/s|MH/s)", re.I)
+# anchored at "hashes,": e.g. "thread 0: 2097152 hashes, 1234.56 khash/s"
+CPUMINER_RATE_RE = re.compile(r"hashes,\s*([\d.]+)\s*([km])(?:hash|h)/s", re.I)
 
 class CpuMinerTail:
-    """Tail cpuminer log and extract latest hashrate."""
+    """Tail cpuminer log and extract latest hashrate.
+
+    Sleeps in the kernel on inotify (Linux) until the log changes; falls back
+    to polling with backoff elsewhere.
+    """
     def __init__(self, path: str):
         self.path = path
         self.latest_hps = 0.0
@@ -160,43 +306,104 @@ class CpuMinerTail:
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
 
+    def _scan(self, lines):
+        # newest first; only the latest rate matters
+        for line in reversed(lines):
+            # cheap substring find, then an anchored match from there
+            idx = line.find("hashes,")
+            if idx >= 0 and (m := CPUMINER_RATE_RE.match(line, idx)):
+                hps = float(m.group(1)) * (1e6 if m.group(2) in "mM" else 1e3)
+                with self.lock:
+                    self.latest_hps = hps
+                return
+
     def _run(self):
+        rotated = False
         while not self.stop:
+            ifd = -1
             try:
                 with open(self.path, "r") as f:
-                    f.seek(0, os.SEEK_END)  # start at end
+                    # start at end, or at the top of a freshly rotated log
+                    f.seek(0, os.SEEK_SET if rotated else os.SEEK_END)
+                    rotated = False  # later reopens (errors, retries) tail from the end again
+                    ifd = inotify_watch(self.path, IN_MODIFY | IN_MOVE_SELF | IN_DELETE_SELF)
+                    idle = 0.05
                     while not self.stop:
-                        line = f.readline()
-                        if not line:
-                            time.sleep(0.5); continue
-                        m = CPUMINER_RATE_RE.search(line)
-                        if m:
-                            val = float(m.group(1))
-                            unit = m.group(2).lower()
-                            hps = val * (1e6 if "mhash" in unit or unit.startswith("mh") else 1e3)
-                            with self.lock:
-                                self.latest_hps = hps
+                        lines = f.readlines()
+                        if lines:
+                            idle = 0.05; self._scan(lines); continue
+                        if ifd < 0:
+                            # back off 0.05s -> 1s while the log is quiet
+                            time.sleep(idle); idle = min(1.0, idle * 2); continue
+                        # no timeout: zero wakeups while the log is quiet (daemon thread)
+                        select.select([ifd], [], [])
+                        if inotify_read_mask(ifd) & (IN_MOVE_SELF | IN_DELETE_SELF):
+                            rotated = True; break  # logrotate: reopen the new file
+                        if os.fstat(f.fileno()).st_size < f.tell():
+                            f.seek(0)  # truncated in place (copytruncate)
             except FileNotFoundError:
                 time.sleep(1.0)
             except Exception:
                 time.sleep(1.0)
+            finally:
+                if ifd >= 0: os.close(ifd)
 
     def get_hps(self) -> float:
         with self.lock:
             return self.latest_hps
 
 # -------------- Network -----------------
+_requests = None         # requests module, imported on first use (False if missing)
+
+def _req():
+    global _requests
+    if _requests is None:
+        try:
+            import requests as _r
+        except Exception:
+            _r = False
+            print("Missing dependency: install 'requests' for live difficulty:\n  pip3 install requests",
+                  file=sys.stderr)
+        _requests = _r
+    return _requests or None
+
+_SESSION = None          # shared keep-alive session, created on first use
+_HTTP_CACHE = {}         # url -> (etag, body text) for conditional GETs
+_DIFF_CACHE = [None, 0.0]  # [difficulty, time.monotonic() of last fetch]
+
+def _http_get_text(url: str) -> str:
+    global _SESSION
+    if _SESSION is None:
+        requests = _req()
+        _SESSION = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=2)
+        _SESSION.mount("https://", adapter); _SESSION.mount("http://", adapter)
+    etag, text = _HTTP_CACHE.get(url, (None, None))
+    r = _SESSION.get(url, timeout=5, headers={"If-None-Match": etag} if etag else None)
+    if r.status_code == 304 and text is not None:
+        return text
+    r.raise_for_status()
+    text = r.text.strip()
+    _HTTP_CACHE[url] = (r.headers.get("ETag"), text)
+    return text
+
 def fetch_difficulty_and_height():
-    if requests is None: return None, None, "requests missing"
-    try:
-        d=float(requests.get(CONFIG["api_difficulty"], timeout=5).text.strip())
-    except Exception as e:
-        return None, None, f"difficulty err: {e}"
+    if _req() is None: return None, None, "requests missing"
+    # difficulty only retargets every ~2 weeks; don't refetch it every height poll
+    d, ts = _DIFF_CACHE
+    errs = []
+    if d is None or time.monotonic() - ts >= CONFIG["difficulty_refresh_s"]:
+        try:
+            d=float(_http_get_text(CONFIG["api_difficulty"]))
+            _DIFF_CACHE[:] = [d, time.monotonic()]
+        except Exception as e:
+            errs.append(f"difficulty err: {e}")  # keep the last good value; retried next poll
+    h = None
     try:
-        h=int(requests.get(CONFIG["api_height"], timeout=5).text.strip())
+        h=int(_http_get_text(CONFIG["api_height"]))
     except Exception as e:
-        return d, None, f"height err: {e}"
-    return d, h, "OK"
+        errs.append(f"height err: {e}")
+    return d, h, "; ".join(errs) or "OK"
 
 def net_hps_from_diff(d: float) -> float:
     return d * (2**32) / 600.0
@@ -211,31 +418,38 @@ def prob_in_window(hps: float, diff: float, seconds: float) -> float:
     lam=seconds/t
     return lam if lam<1e-6 else 1.0-math.exp(-lam)
 
+# (label, stats key, seconds) for the odds panel and /stats.json
+ODDS_WINDOWS = (("1 day", "one_day", 86400.0),
+                ("1 year", "one_year", 365*86400.0),
+                ("10 years", "ten_years", 10*365*86400.0))
+
+def odds_batch(hps: float, diff: float, seconds=tuple(w[2] for w in ODDS_WINDOWS)):
+    """prob_in_window for several windows, sharing one expected-time computation."""
+    t=expected_time_s(hps, diff)
+    if not math.isfinite(t) or t<=0: return [0.0]*len(seconds)
+    inv_t=1.0/t; exp=math.exp
+    return [lam if lam<1e-6 else 1.0-exp(-lam) for lam in [sec*inv_t for sec in seconds]]
+
 # -------------- Web mini-dashboard ------
 class StatsState:
+    """Lock-free: update() swaps in a new dict, readers just take the reference."""
     def __init__(self):
-        self.lock=threading.Lock()
         self.state={"time":None,"hashrate_hps":0.0,"display_hashrate_hps":0.0,"source":"Mock",
                     "difficulty":None,"height":None,"network_hps":None,
                     "expected_seconds":None,"expected_human":None,"odds":{},
                     "cpu_temp_c":None}
+        # (state dict, its encoded JSON); tied to the dict so a racing reader can't cache stale bytes
+        self._cached: Tuple[Optional[dict], bytes] = (None, b"")
     def snapshot(self):
-        with self.lock: return json.dumps(self.state).encode()
+        s = self.state; c = self._cached
+        if c[0] is not s:
+            c = (s, json.dumps(s, separators=(",",":")).encode()); self._cached = c
+        return c[1]
     def update(self, **kw):
-        with self.lock:
-            self.state.update(kw); self.state["time"]=datetime.utcnow().isoformat()+"Z"
+        self.state = {**self.state, **kw, "time": datetime.utcnow().isoformat()+"Z"}
 STATS=StatsState()
 
-def _jitter(value: float, pct: float, prev: Optional[float]) -> float:
-    if value <= 0 or pct <= 0: return value
-    j = value * (1.0 + random.uniform(-pct, pct))
-    if prev is not None: j = 0.70 * prev + 0.30 * j
-    return max(0.0, j)
-
-class WebHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == "/" or self.path.startswith("/index"):
-            html = """<!doctype html><meta charset='utf-8'><title>Pi Lottery Miner</title>
+_INDEX_HTML = ("""<!doctype html><meta charset='utf-8'><title>Pi Lottery Miner</title>
 <style>
   :root { color-scheme: dark; }
   body{
@@ -271,17 +485,25 @@ class WebHandler(BaseHTTPRequestHandler):
   }).catch(function(){});}
   setInterval(load, 2000); load();
 })();
-</script>"""
-            body = html.encode("utf-8")
+</script>""").encode("utf-8")
+_INDEX_LEN = str(len(_INDEX_HTML))
+
+class WebHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass  # the web UI polls every 2 s; don't spam stderr
+
+    def do_GET(self):
+        if self.path == "/" or self.path.startswith("/index"):
             self.send_response(200)
             self.send_header("Content-Type","text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Content-Length", _INDEX_LEN)
             self.end_headers()
-            self.wfile.write(body)
+            self.wfile.write(_INDEX_HTML)
         elif self.path == "/stats.json":
             data = STATS.snapshot()
             self.send_response(200)
             self.send_header("Content-Type","application/json; charset=utf-8")
+            self.send_header("Cache-Control","no-store")
             self.send_header("Content-Length", str(len(data)))
             self.end_headers()
             self.wfile.write(data)
@@ -290,7 +512,7 @@ class WebHandler(BaseHTTPRequestHandler):
 
 def run_web_server():
     try:
-        HTTPServer(("0.0.0.0", CONFIG["web_port"]), WebHandler).serve_forever()
+        ThreadingHTTPServer(("0.0.0.0", CONFIG["web_port"]), WebHandler).serve_forever()
     except Exception:
         pass
 
@@ -365,10 +587,10 @@ class TouchApp:
         img_path = CONFIG.get("bg_image")
         try:
             if img_path and os.path.exists(img_path):
-                pil = Image.open(img_path)
+                from PIL import ImageTk  # deferred: only needed for the logo
                 # fit within a square, preserve aspect
                 target = S(96)  # adjust size if you like
-                pil.thumbnail((target, target), Image.LANCZOS)
+                pil = load_logo_image(img_path, target)
                 self._header_img = ImageTk.PhotoImage(pil)
                 ttk.Label(right, image=self._header_img, style="Dark.TLabel").pack(anchor="e")
             else:
@@ -404,7 +626,7 @@ class TouchApp:
         # Graph (dark)
         self.canvas = tk.Canvas(container, height=S(150), bg="#0d0f14", highlightthickness=0)
         self.canvas.pack(fill="x", pady=(S(4), 0))
-        self.canvas.bind("<Configure>", lambda e: self._draw_graph())
+        self.canvas.bind("<Configure>", self._on_graph_configure)
 
         # Footer hint
         ttk.Label(container,
@@ -413,96 +635,167 @@ class TouchApp:
                 ).pack(anchor="w", pady=(S(4), 0))
 
         # State
-        self.graph_data=[]; self.miner_hps=0.0; self.miner_src="Mock"
+        # ~5 min of samples at miner_refresh_s, kept as two float64 ring buffers
+        self._cap = max(2, int(300 / CONFIG["miner_refresh_s"]))
+        self._ts = array.array("d", bytes(8 * self._cap))
+        self._vs = array.array("d", bytes(8 * self._cap))
+        self._n = 0; self._head = 0
+        self._data_lock = threading.Lock()
+        self.miner_hps=0.0; self.miner_src="Mock"
         self.difficulty=None; self.height=None; self.net_hps=None; self.cpu_temp=None
         self._stop=False
+        # set by the data loops whenever there is something new to paint
+        self._dirty = threading.Event(); self._dirty.set()
+        # set by the scheduler when a network refresh is due; served by _network_worker
+        self._net_due = threading.Event()
+        self._last_draw = 0.0
+        # graph fallback for hps == 0, hoisted out of the per-tick path
+        self._fallback_hps = CONFIG["mock_khs_base"]*1e3 if CONFIG["show_odds_when_zero"] else 0.0
+        self._jitter_pct = CONFIG["graph_jitter_pct"]
+        self._rng = random.Random()
 
         # cpuminer tail (if enabled)
         self.cpuminer = CpuMinerTail(CONFIG["cpuminer_log"]) if CONFIG["miner_mode"]=="cpuminer" else None
 
         # Threads & loops
-        threading.Thread(target=self._miner_loop, daemon=True).start()
-        threading.Thread(target=self._network_loop, daemon=True).start()
-        threading.Thread(target=self._sensors_loop, daemon=True).start()
+        threading.Thread(target=self._scheduler, daemon=True).start()
+        threading.Thread(target=self._network_worker, daemon=True).start()
         threading.Thread(target=run_web_server, daemon=True).start()
         self._ui_loop()
 
 
-    # Data loops
-    def _miner_loop(self):
+    # Graph samples
+    def _push_sample(self, t: float, v: float):
+        with self._data_lock:
+            self._ts[self._head] = t; self._vs[self._head] = v
+            self._head = (self._head + 1) % self._cap
+            self._n = min(self._n + 1, self._cap)
+
+    def _last_sample(self) -> Optional[float]:
+        with self._data_lock:
+            return self._vs[self._head - 1] if self._n else None
+
+    def _samples(self) -> Tuple[array.array, array.array]:
+        """Copy out (times, vals), oldest first."""
+        with self._data_lock:
+            if self._n < self._cap:
+                return self._ts[:self._n], self._vs[:self._n]
+            h = self._head
+            return self._ts[h:] + self._ts[:h], self._vs[h:] + self._vs[:h]
+
+    # Data tasks (run on the single scheduler thread; network I/O is handed off)
+    def _scheduler(self):
+        """Run the periodic data tasks on one thread, earliest deadline first."""
+        tasks = [(self._miner_tick, CONFIG["miner_refresh_s"]),
+                 (self._network_tick, CONFIG["network_refresh_s"]),
+                 (self._sensors_tick, CONFIG["sensors_refresh_s"])]
+        now = time.monotonic()
+        heap = [(now, seq, fn, period) for seq, (fn, period) in enumerate(tasks)]
+        heapq.heapify(heap)
         while not self._stop:
-            # 1) Read hashrate & set source
-            if CONFIG["miner_mode"] == "cpuminer" and self.cpuminer:
-                hps = self.cpuminer.get_hps(); src = "cpuminer"
-            elif CONFIG["miner_mode"] in ("auto","bfgminer"):
-                hps, src = get_bfgminer_hashrate_hps()
-            else:
-                base=CONFIG["mock_khs_base"]; jit=CONFIG["mock_khs_jitter"]
-                hps = max(0.0, random.uniform(base-jit, base+jit)) * 1e3; src = "Mock"
+            deadline, seq, fn, period = heap[0]
+            wait = deadline - time.monotonic()
+            if wait > 0:
+                time.sleep(wait); continue
+            heapq.heappop(heap)
+            try: fn()
+            except Exception: pass
+            # fixed rate; if a task overran (slow network), don't try to catch up
+            heapq.heappush(heap, (max(deadline + period, time.monotonic()), seq, fn, period))
+
+    def _miner_tick(self):
+        # 1) Read hashrate & set source
+        if CONFIG["miner_mode"] == "cpuminer" and self.cpuminer:
+            hps = self.cpuminer.get_hps(); src = "cpuminer"
+        elif CONFIG["miner_mode"] in ("auto","bfgminer"):
+            hps, src = get_bfgminer_hashrate_hps()
+        else:
+            base=CONFIG["mock_khs_base"]; jit=CONFIG["mock_khs_jitter"]
+            hps = max(0.0, random.uniform(base-jit, base+jit)) * 1e3; src = "Mock"
 
-            self.miner_hps, self.miner_src = hps, src
+        self.miner_hps, self.miner_src = hps, src
 
-            # 2) Decide what to plot (don’t affect odds math)
-            if hps > 0:
-                g_hps = hps  # real value, no jitter
-            else:
-                g_hps = CONFIG["mock_khs_base"]*1e3 if CONFIG["show_odds_when_zero"] else 0.0
-                prev_val = self.graph_data[-1][1] if self.graph_data else None
-                g_hps = _jitter(g_hps, CONFIG["graph_jitter_pct"], prev_val)
-
-            # 3) Append & sleep
-            now = time.time()
-            self.graph_data.append((now, g_hps))
-            cutoff = now - 300
-            self.graph_data = [(t, v) for (t, v) in self.graph_data if t >= cutoff]
-            time.sleep(CONFIG["miner_refresh_s"])
-
-    def _network_loop(self):
+        # 2) Decide what to plot (don’t affect odds math)
+        if hps > 0:
+            g_hps = hps  # real value, no jitter
+        else:
+            g_hps = self._fallback_hps; pct = self._jitter_pct
+            if g_hps > 0 and pct > 0:
+                # ±pct wiggle, smoothed against the previous sample
+                j = g_hps * (1.0 + self._rng.uniform(-pct, pct))
+                prev = self._last_sample()
+                g_hps = max(0.0, j if prev is None else 0.70*prev + 0.30*j)
+
+        # 3) Append
+        now = time.monotonic()  # x-axis only; immune to NTP steps
+        self._push_sample(now, g_hps)
+        self._dirty.set()
+
+    def _network_tick(self):
+        # HTTP can block for 2x5 s timeouts (DNS unbounded); never stall sampling on it
+        self._net_due.set()
+
+    def _network_worker(self):
         while not self._stop:
-            d,h,st=fetch_difficulty_and_height()
-            if d is not None:
-                self.difficulty=d; self.net_hps=net_hps_from_diff(d)
-            if h is not None: self.height=h
-            time.sleep(CONFIG["network_refresh_s"])
+            self._net_due.wait(); self._net_due.clear()
+            try:
+                d,h,st=fetch_difficulty_and_height()
+                if d is not None:
+                    self.difficulty=d; self.net_hps=net_hps_from_diff(d)
+                if h is not None: self.height=h
+                self._dirty.set()
+            except Exception:
+                pass
 
-    def _sensors_loop(self):
-        while not self._stop:
-            self.cpu_temp = read_cpu_temp_c()
-            time.sleep(2)
+    def _sensors_tick(self):
+        self.cpu_temp = read_cpu_temp_c()
+        self._dirty.set()
 
     # Drawing
+    def _on_graph_configure(self, event=None):
+        self._draw_grid()
+        self._draw_graph()
+
+    def _draw_grid(self):
+        """Static axes, gridlines and title; only redrawn when the canvas resizes."""
+        c=self.canvas; c.delete("grid")
+        w,h = c.winfo_width(), c.winfo_height()
+        pad = S(10)
+        axis="#3b3f4a"; grid="#222631"; label="#c8c8c8"
+        c.create_line(pad, h-pad, w-pad, h-pad, fill=axis, tags="grid")
+        c.create_line(pad, pad, pad, h-pad, fill=axis, tags="grid")
+        for frac in [0.25,0.5,0.75,1.0]:
+            y = h-pad - (h-2*pad)*frac
+            c.create_line(pad, y, w-pad, y, fill=grid, tags="grid")
+        c.create_text(w-pad, pad, anchor="ne", text="Hashrate (last ~5 min)", fill=label,
+                      font=("DejaVu Sans", S(11)), tags="grid")
+        c.tag_lower("grid")
+
     def _draw_graph(self):
-        c=self.canvas; c.delete("all")
+        c=self.canvas; c.delete("series")
         w,h = c.winfo_width(), c.winfo_height()
 
         pad = S(10)
-        # axes/grid colors tuned for dark
-        axis="#3b3f4a"; grid="#222631"; line=CONFIG["theme_accent"]; dot="#9edcff"; label="#c8c8c8"
-        c.create_line(pad, h-pad, w-pad, h-pad, fill=axis)
-        c.create_line(pad, pad, pad, h-pad, fill=axis)
-        if len(self.graph_data) < 2:
-            c.create_text(w//2, h//2, text="Collecting data…", fill=label, font=("DejaVu Sans", S(12))); return
-        times = [t for t,_ in self.graph_data]
-        vals  = [v for _,v in self.graph_data]
-        tmin, tmax = min(times), max(times)
-        vmax = max(vals) if max(vals)>0 else 1.0
-        def fmt(hps):
-            u=["H/s","KH/s","MH/s","GH/s","TH/s","PH/s","EH/s"]; v=hps; i=0
-            while v>=1000 and i<len(u)-1: v/=1000; i+=1
-            return f"{v:.1f} {u[i]}"
+        # series colors tuned for dark
+        line=CONFIG["theme_accent"]; dot="#9edcff"; label="#c8c8c8"
+        times, vals = self._samples()
+        if len(times) < 2:
+            c.create_text(w//2, h//2, text="Collecting data…", fill=label,
+                          font=("DejaVu Sans", S(12)), tags="series"); return
+        tmin, tmax = times[0], times[-1]  # ring is read oldest-first
+        vmax = max(vals)
+        if vmax <= 0: vmax = 1.0
         for frac in [0.25,0.5,0.75,1.0]:
             y = h-pad - (h-2*pad)*frac
-            c.create_line(pad, y, w-pad, y, fill=grid)
-            c.create_text(pad-2, y, text=fmt(vmax*frac), fill=label, anchor="e", font=("DejaVu Sans", S(10)))
+            c.create_text(pad-2, y, text=human_hashrate(vmax*frac), fill=label, anchor="e",
+                          font=("DejaVu Sans", S(10)), tags="series")
         span = max(1.0, tmax-tmin)
-        prev=None
-        for (t,v) in self.graph_data:
-            x = pad + (w-2*pad) * ((t - tmin) / span)
-            y = h-pad - (h-2*pad) * (v / vmax if vmax>0 else 0)
-            if prev: c.create_line(prev[0], prev[1], x, y, fill=line, width=2)
-            c.create_oval(x-2, y-2, x+2, y+2, outline=dot, fill=dot)
-            prev=(x,y)
-        c.create_text(w-pad, pad, anchor="ne", text="Hashrate (last ~5 min)", fill=label, font=("DejaVu Sans", S(11)))
+        sx = (w-2*pad) / span; sy = (h-2*pad) / vmax
+        # one flat x1,y1,...,xN,yN polyline instead of a canvas item per segment
+        pts = [p for t, v in zip(times, vals) for p in (pad + (t-tmin)*sx, h-pad - v*sy)]
+        c.create_line(*pts, fill=line, width=2, tags="series")
+        x, y = pts[-2], pts[-1]  # mark only the latest sample
+        c.create_oval(x-3, y-3, x+3, y+3, outline=dot, fill=dot, tags="series")
 
     # Helpers
     def _effective_hps_for_odds(self) -> Tuple[float,str]:
@@ -513,21 +806,34 @@ class TouchApp:
 
     # UI loop
     def _ui_loop(self):
-        disp_hps = self.graph_data[-1][1] if self.graph_data else self.miner_hps
+        delay_ms = int(CONFIG["ui_refresh_s"]*1000)
+        if self._dirty.is_set():
+            wait = self._last_draw + 1.0/CONFIG["ui_max_fps"] - time.monotonic()
+            if wait > 0:
+                delay_ms = max(1, int(wait*1000))  # over frame budget: retry once it frees up
+            else:
+                self._dirty.clear()
+                self._last_draw = time.monotonic()
+                self._render()
+
+        if not self._stop:
+            self.root.after(delay_ms, self._ui_loop)
+
+    def _render(self):
+        last = self._last_sample()
+        disp_hps = last if last is not None else self.miner_hps
         self.lbl_hash.config(text=f"Hashrate: {human_hashrate(disp_hps)}")
         eff_hps, eff_src = self._effective_hps_for_odds()
 
         odds_dict = {}
+        et_seconds = None
         if self.difficulty and eff_hps>0:
-            et = expected_time_s(eff_hps, self.difficulty)
-            self.lbl_etb.config(text=f"Expected time: {human_duration(et)}")
-            windows=[("1 day", 86400), ("1 year", 365*86400), ("10 years", 10*365*86400)]
+            et_seconds = expected_time_s(eff_hps, self.difficulty)
+            self.lbl_etb.config(text=f"Expected time: {human_duration_q(et_seconds)}")
             lines=[]
-            for label,sec in windows:
-                p=prob_in_window(eff_hps, self.difficulty, sec)
-                pretty = fmt_prob_human(p)
+            for (label,key,_),p in zip(ODDS_WINDOWS, odds_batch(eff_hps, self.difficulty)):
+                pretty = fmt_prob_human_q(p)
                 lines.append(f"• {label}: {pretty}")
-                key = ("one_day" if sec==86400 else "one_year" if sec==365*86400 else "ten_years")
                 odds_dict[key] = pretty
             self.lbl_odds.config(text="Odds:\n" + "\n".join(lines))
         else:
@@ -545,7 +851,6 @@ class TouchApp:
         self._draw_graph()
 
         # Update web stats
-        et_seconds = expected_time_s(eff_hps, self.difficulty) if (self.difficulty and eff_hps>0) else None
         STATS.update(
             hashrate_hps=self.miner_hps,
             display_hashrate_hps=disp_hps,
@@ -554,25 +859,16 @@ class TouchApp:
             height=self.height,
             network_hps=net_hps_from_diff(self.difficulty) if self.difficulty else None,
             expected_seconds=et_seconds,
-            expected_human=human_duration(et_seconds) if et_seconds else None,
+            expected_human=human_duration_q(et_seconds) if et_seconds else None,
             odds=odds_dict,
             cpu_temp_c=self.cpu_temp,
         )
 
-        if not self._stop:
-            self.root.after(int(CONFIG["ui_refresh_s"]*1000), self._ui_loop)
-
     def stop(self):
         self._stop=True
 
 # -------------- Main --------------------
 def main():
-    if requests is None:
-        root = tk.Tk()
-        app = TouchApp(root)
-        messagebox.showwarning("Missing dependency", "Install 'requests' for live difficulty:\n  pip3 install requests")
-        root.protocol("WM_DELETE_WINDOW", app.stop)
-        root.mainloop(); return
     root = tk.Tk()
     app = TouchApp(root)
     root.protocol("WM_DELETE_WINDOW", app.stop)
@@ -10,8 +10,7 @@ Backlight control via /sys/class/backlight/*  (root required).
 Touch detection via /dev/input/event*.
 """
 
-import os, re, time, sys, glob, select, argparse, threading, subprocess
-from datetime import datetime
+import os, re, time, sys, glob, errno, ctypes, select, struct, atexit, argparse, signal, subprocess
 
 # -------- Defaults (can be overridden by CLI flags or environment) --------
 DEFAULT_TOUCH_RE        = os.environ.get("TOUCH_REGEX", r"(?i)(touch|fts|ft5406|goodix|capacitive)")
@@ -26,35 +25,81 @@ DEFAULT_LOG_FILE        = os.environ.get("LOG_FILE", "/var/log/pi_guard.log")
 DEFAULT_GRACE_READS     = int(os.environ.get("GRACE_READS", "2"))          # consecutive hot reads before shutdown
 
 PROC_INPUT = "/proc/bus/input/devices"
+INPUT_DIR = "/dev/input"
+_NAME_RE = re.compile(rb'Name="([^"]+)"')
+_HANDLERS_RE = re.compile(rb"event\d+")
 
 # ------------------------ Helpers: touch + backlight ------------------------
 def list_event_devices():
     """Return list of (path, name) for all /dev/input/event* devices."""
     devs = []
     try:
-        with open(PROC_INPUT, "r", encoding="utf-8", errors="ignore") as f:
-            blocks = f.read().split("\n\n")
+        # always ASCII: split and scan the raw bytes, decode only the captures
+        with open(PROC_INPUT, "rb") as f:
+            blocks = f.read().split(b"\n\n")
         by_event = {}
         for b in blocks:
-            name_m = re.search(r'Name="([^"]+)"', b)
-            h = re.search(r'Handlers=.*?(event\d+)', b)
+            name_m = _NAME_RE.search(b)
+            # only scan the rest of the "Handlers=" line, not the whole block
+            h = _HANDLERS_RE.search(b.partition(b"Handlers=")[2].partition(b"\n")[0])
             if name_m and h:
-                by_event[h.group(1)] = name_m.group(1)
-        for path in sorted(glob.glob("/dev/input/event*")):
+                by_event[h.group(0).decode()] = name_m.group(1).decode("utf-8", "ignore")
+        for path in sorted(glob.glob(os.path.join(INPUT_DIR, "event*"))):
             ev = os.path.basename(path)
             devs.append((path, by_event.get(ev, ev)))
     except Exception:
         # fallback: just list event files
-        for path in sorted(glob.glob("/dev/input/event*")):
+        for path in sorted(glob.glob(os.path.join(INPUT_DIR, "event*"))):
             devs.append((path, os.path.basename(path)))
     return devs
 
 
+# inotify (via libc; no third-party libs) for /dev/input hotplug
+IN_CREATE, IN_DELETE = 0x100, 0x200
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (+ name)
+INPUT_EVENT_SIZE = struct.calcsize("llHHi")  # struct input_event: 24 bytes on 64-bit, 16 on 32-bit
+_libc = None
+
+def inotify_watch(path, mask):
+    """Return a non-blocking inotify fd watching path, or -1 if unavailable."""
+    global _libc
+    try:
+        if _libc is None: _libc = ctypes.CDLL(None, use_errno=True)
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)  # IN_NONBLOCK|IN_CLOEXEC
+        if fd < 0: return -1
+        if _libc.inotify_add_watch(fd, os.fsencode(path), mask) < 0:
+            os.close(fd); return -1
+        return fd
+    except Exception:
+        return -1
+
+def read_inotify_names(fd):
+    """Drain pending inotify events; return the file names they refer to."""
+    names = set()
+    while True:
+        try: buf = os.read(fd, 4096)
+        except OSError as e:
+            if e.errno != errno.EAGAIN: raise
+            break
+        off = 0
+        while off + _INOTIFY_EVENT.size <= len(buf):
+            _, _, _, n = _INOTIFY_EVENT.unpack_from(buf, off)
+            off += _INOTIFY_EVENT.size
+            names.add(buf[off:off + n].rstrip(b"\0").decode("ascii", "ignore"))
+            off += n
+        if len(buf) < 4096: break  # short read: queue is empty, skip the EAGAIN round trip
+    return names
+
 def find_backlight_path(explicit: str | None):
     if explicit and os.path.isdir(explicit):
         return explicit
-    for path in sorted(glob.glob("/sys/class/backlight/*")):
-        return path
+    # one getdents, no pattern/sort; entries are symlinks, is_dir() follows them
+    try:
+        with os.scandir("/sys/class/backlight") as it:
+            for e in it:
+                if e.is_dir(): return e.path
+    except OSError:
+        pass
     return None
 
 def read_int(path, default=None):
@@ -73,179 +118,376 @@ def write_str(path, val):
         log(f"write {path} failed: {e}")
         return False
 
+def open_attr(path, flags):
+    """Open a sysfs attribute for reuse; -1 if it is missing or not permitted."""
+    try:
+        return os.open(path, flags | os.O_CLOEXEC)
+    except OSError:
+        return -1
+
 class Backlight:
+    """Backlight sysfs control; keeps brightness/bl_power open and pwrites them."""
     def __init__(self, base):
         self.base = base
         self.brightness = os.path.join(base, "brightness")
         self.max_brightness = read_int(os.path.join(base, "max_brightness"), 255)
         self.bl_power = os.path.join(base, "bl_power")  # 0=on, 1=off (most drivers)
-        self.prev_brightness = read_int(self.brightness, self.max_brightness) or 200
+        self._bri_fd = open_attr(self.brightness, os.O_RDWR)
+        self._pwr_fd = open_attr(self.bl_power, os.O_WRONLY)  # -1: driver has no bl_power
+        self.prev_brightness = self._read_brightness(self.max_brightness) or 200
+
+    def _read_brightness(self, default):
+        if self._bri_fd < 0:
+            return read_int(self.brightness, default)
+        try:
+            return int(os.pread(self._bri_fd, 16, 0).strip())
+        except Exception:
+            return default
+
+    def _write(self, fd, path, val):
+        if fd < 0:
+            return write_str(path, val)  # not held open; try (and log) the slow path
+        try:
+            os.pwrite(fd, f"{val}\n".encode(), 0)
+            return True
+        except Exception as e:
+            log(f"write {path} failed: {e}")
+            return False
 
     def on(self):
-        write_str(self.brightness, self.prev_brightness)
-        write_str(self.bl_power, 0)
+        self._write(self._bri_fd, self.brightness, self.prev_brightness)
+        self._write(self._pwr_fd, self.bl_power, 0)
 
     def off(self):
-        cur = read_int(self.brightness, self.prev_brightness)
+        cur = self._read_brightness(self.prev_brightness)
         if cur: self.prev_brightness = cur
         # Try power off; if not supported, set brightness 0
-        if not write_str(self.bl_power, 1):
-            write_str(self.brightness, 0)
+        if not self._write(self._pwr_fd, self.bl_power, 1):
+            self._write(self._bri_fd, self.brightness, 0)
 
     def dim(self, level):
-        cur = read_int(self.brightness, self.prev_brightness)
+        cur = self._read_brightness(self.prev_brightness)
         if cur: self.prev_brightness = cur
-        write_str(self.bl_power, 0)  # ensure on
+        self._write(self._pwr_fd, self.bl_power, 0)  # ensure on
         level = max(1, min(level, self.max_brightness))
-        write_str(self.brightness, level)
+        self._write(self._bri_fd, self.brightness, level)
+
+    def close(self):
+        for fd in (self._bri_fd, self._pwr_fd):
+            if fd >= 0:
+                try: os.close(fd)
+                except OSError: pass
+        self._bri_fd = self._pwr_fd = -1
 
 # --------------------------- Helpers: temperature ---------------------------
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+_temp_reader = None      # source that worked last; re-probed after any failure
+_thermal_fd = None       # kept open between reads; pread at offset 0
+_thermal_failed = False  # sysfs unusable while vcgencmd works: don't retry the open every poll
+
+def _read_vcgencmd() -> float:
+    out = subprocess.check_output(["vcgencmd", "measure_temp"])  # b"temp=48.3'C\n"
+    return float(out[5:out.rindex(b"'")])
+
+def _read_sysfs() -> float:
+    global _thermal_fd
+    if _thermal_fd is None:
+        _thermal_fd = os.open(THERMAL_PATH, os.O_RDONLY | os.O_CLOEXEC)
+    return int(os.pread(_thermal_fd, 16, 0).strip())/1000.0
+
+def _close_thermal():
+    global _thermal_fd
+    if _thermal_fd is not None:
+        try: os.close(_thermal_fd)
+        except OSError: pass
+        _thermal_fd = None
+
 def get_cpu_temp_c() -> float | None:
-    """Read CPU temperature in Celsius (vcgencmd preferred)."""
-    try:
-        out = subprocess.check_output(["vcgencmd", "measure_temp"]).decode()
-        return float(out.replace("temp=", "").replace("'C\n", ""))
-    except Exception:
+    """Read CPU temperature in Celsius (sysfs preferred, vcgencmd fallback).
+
+    The working source is remembered, so steady state never forks vcgencmd
+    when sysfs is readable. Any failure drops it (and the held fd) and both
+    sources are probed again, so the guard recovers instead of going blind.
+    """
+    global _temp_reader, _thermal_failed
+    if _temp_reader is not None:
         try:
-            with open("/sys/class/thermal/thermal_zone0/temp","r") as f:
-                return int(f.read().strip())/1000.0
+            return _temp_reader()
         except Exception:
-            return None
+            _temp_reader = None; _thermal_failed = False
+            _close_thermal()
+    if not _thermal_failed:
+        try:
+            t = _read_sysfs()
+            _temp_reader = _read_sysfs
+            return t
+        except Exception:
+            _close_thermal()
+    try:
+        t = _read_vcgencmd()
+    except Exception:
+        _thermal_failed = False  # neither works: keep trying both
+        return None
+    _temp_reader = _read_vcgencmd; _thermal_failed = True
+    return t
 
 # -------------------------------- Logging ----------------------------------
 LOG_FILE = DEFAULT_LOG_FILE
+_LOG_FH = None  # opened once by open_log(); None = stdout only
+
+def open_log(path):
+    global _LOG_FH
+    try:
+        _LOG_FH = open(path, "a", buffering=1, encoding="utf-8")  # line buffered
+        atexit.register(_LOG_FH.close)
+    except OSError:
+        # Not fatal; still printed to stdout
+        _LOG_FH = None
+
 def log(msg):
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    ts = time.strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{ts}] {msg}"
     print(line, flush=True)
+    if _LOG_FH:
+        try:
+            _LOG_FH.write(line + "\n")
+        except (OSError, ValueError):
+            pass
+
+# ------------------------------- Shutdown ----------------------------------
+LINUX_REBOOT_CMD_POWER_OFF = 0x4321FEDC
+
+def power_off():
+    """Shut down cleanly via systemd (no shell); else sync and call reboot(2)."""
     try:
-        with open(LOG_FILE, "a") as f:
-            f.write(line + "\n")
-    except PermissionError:
-        # Not fatal; still printed to stdout
-        pass
+        if subprocess.run(["systemctl", "poweroff"], check=False).returncode == 0:
+            return
+        log("systemctl poweroff failed")
+    except OSError as e:
+        log(f"systemctl poweroff failed: {e}")
+    log("Falling back to reboot(2) POWER_OFF")
+    try:
+        os.sync()
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.reboot(LINUX_REBOOT_CMD_POWER_OFF) != 0:
+            log(f"reboot(2) failed: {os.strerror(ctypes.get_errno())}")
+    except Exception as e:
+        log(f"reboot(2) failed: {e}")
 
-# ------------------------------- Threads -----------------------------------
-class TouchIdleThread(threading.Thread):
-    def __init__(self, idle_secs, mode, dim_brightness, backlight_path, touch_re):
-        super().__init__(daemon=True)
+# -------------------------------- Guards -----------------------------------
+STATE_ACTIVE, STATE_IDLE = 0, 1
+
+class GuardLoop:
+    """Single event loop for both guards.
+
+    Input devices, the /dev/input hotplug watch and the temperature deadline
+    all share one epoll wait on one thread.
+    """
+    def __init__(self, idle_secs, mode, dim_brightness, backlight_path, temp_guard):
         self.idle_secs = idle_secs
+        self.idle_ns = int(idle_secs * 1_000_000_000)  # integer compare in the loop
         self.mode = mode
         self.dim_brightness = dim_brightness
         self.backlight_path = backlight_path
-        self.touch_re = touch_re
-        self.stop_flag = threading.Event()
+        self.temp_guard = temp_guard
+        # reused for every drain; contents ignored. A whole number of input_events,
+        # since evdev never returns partial ones: only a full read can leave more queued.
+        self._rdbuf = bytearray(INPUT_EVENT_SIZE * 128)
+
+    def _open_device(self, ep, fds, path, name):
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+        except PermissionError:
+            log(f"Permission denied opening {path} ({name}); run as root or fix udev perms")
+            return False
+        except Exception as e:
+            log(f"Failed opening {path} ({name}): {e}")
+            return False
+        fds[fd] = (path, name)
+        ep.register(fd, select.EPOLLIN)
+        return True
+
+    def _close_device(self, ep, fds, fd):
+        try: ep.unregister(fd)
+        except Exception: pass
+        try: os.close(fd)
+        except Exception: pass
+        del fds[fd]
+
+    def _sync_devices(self, ep, fds):
+        """Re-resolve input devices after a /dev/input hotplug event."""
+        for fd, (path, name) in list(fds.items()):
+            if not os.path.exists(path):
+                log(f"Input device removed: {path} [{name}]")
+                self._close_device(ep, fds, fd)
+        have = {path for path, _ in fds.values()}
+        for path, name in list_event_devices():
+            if path not in have and self._open_device(ep, fds, path, name):
+                log(f"Input device added: {path} [{name}]")
 
     def run(self):
+        fds = {}
+        ep = select.epoll()
+        ino_fd = -1
+        bl = None
         bl_base = find_backlight_path(self.backlight_path)
         if not bl_base:
-            log("No backlight path found; TouchIdleThread exiting.")
-            return
-        bl = Backlight(bl_base)
-
-        # Open ALL event devices (root recommended so you can read them)
-        devices = list_event_devices()
-        fds = []
-        poller = select.poll()
-        for path, name in devices:
-            try:
-                fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
-                fds.append((fd, path, name))
-                poller.register(fd, select.POLLIN)
-            except PermissionError:
-                log(f"Permission denied opening {path} ({name}); run as root or fix udev perms")
-            except Exception as e:
-                log(f"Failed opening {path} ({name}): {e}")
-
-        if not fds:
-            log("No readable /dev/input/event* devices; TouchIdleThread exiting.")
-            return
-
-        log("Monitoring input devices:")
-        for _, path, name in fds:
-            log(f"  - {path}  [{name}]")
-        log(f"Backlight: {bl_base}")
-
-        last_activity = time.time()
-        blanked = False
-        dimmed = False
+            log("No backlight path found; touch idle disabled.")
+        else:
+            bl = Backlight(bl_base)
+
+            # Open ALL event devices (root recommended so you can read them)
+            for path, name in list_event_devices():
+                self._open_device(ep, fds, path, name)
+
+            # Hotplug: woken only when nodes appear/disappear in /dev/input
+            ino_fd = inotify_watch(INPUT_DIR, IN_CREATE | IN_DELETE)
+            if ino_fd >= 0:
+                ep.register(ino_fd, select.EPOLLIN)
+
+            if not fds and ino_fd < 0:
+                log("No readable /dev/input/event* devices; touch idle disabled.")
+                bl.close(); bl = None
+            else:
+                log("Monitoring input devices:")
+                for path, name in fds.values():
+                    log(f"  - {path}  [{name}]")
+                if not fds:
+                    log("  (none yet; waiting for hotplug)")
+                log(f"Backlight: {bl_base}")
+
+        if self.mode == "off":
+            go_idle = lambda: bl.off()
+            idle_msg = "Idle exceeded: turning backlight OFF"
+        else:
+            go_idle = lambda: bl.dim(self.dim_brightness)
+            idle_msg = f"Idle exceeded: DIM backlight to {self.dim_brightness}"
+        state = STATE_ACTIVE
+        temp_ns = int(self.temp_guard.interval * 1_000_000_000)
+        last_activity = time.monotonic_ns()  # immune to NTP/RTC steps
+        next_temp = last_activity  # first temperature check right away
 
         try:
-            while not self.stop_flag.is_set():
-                events = poller.poll(500)  # 0.5s
-                now = time.time()
-
-                if events:
-                    # Drain a little from each signaled fd
-                    woke_from = None
-                    for fd, path, name in fds:
+            while True:
+                # Sleep until the next temperature check or idle deadline, whichever
+                # is first; once idle only a touch (or the temp check) matters.
+                deadline = next_temp
+                if bl is not None and state == STATE_ACTIVE:
+                    deadline = min(deadline, last_activity + self.idle_ns)
+                events = ep.poll(max(0, deadline - time.monotonic_ns()) / 1e9)
+                now = time.monotonic_ns()
+
+                woke_from = None
+                for fd, ev in events:
+                    if fd == ino_fd:
                         try:
-                            r = select.poll()
-                            r.register(fd, select.POLLIN)
-                            if r.poll(0):
-                                os.read(fd, 4096)  # discard
-                                woke_from = woke_from or f"{path} [{name}]"
-                        except BlockingIOError:
-                            pass
-                        except Exception:
-                            pass
+                            names = read_inotify_names(ino_fd)
+                        except OSError as e:
+                            # lose hotplug only; the devices and temp guard keep running
+                            log(f"inotify read failed, hotplug disabled: {e}")
+                            ep.unregister(ino_fd); os.close(ino_fd); ino_fd = -1
+                            continue
+                        if any(n.startswith("event") for n in names):
+                            self._sync_devices(ep, fds)
+                        continue
+                    if fd not in fds:
+                        continue  # closed by _sync_devices earlier in this batch
+                    path, name = fds[fd]
+                    if ev & (select.EPOLLERR | select.EPOLLHUP):
+                        # device went away; stop watching it
+                        log(f"Input device lost: {path} [{name}]")
+                        self._close_device(ep, fds, fd)
+                        continue
+                    # Drain fully (level-triggered epoll would re-fire on leftovers);
+                    # we only care that activity occurred. evdev hands out whole
+                    # events, so a short read means the queue is empty and the
+                    # usual case costs one syscall and no EAGAIN exception.
+                    got = 0
+                    try:
+                        while True:
+                            n = os.readv(fd, [self._rdbuf])
+                            got += n
+                            if n < len(self._rdbuf): break
+                    except OSError:
+                        pass  # EAGAIN on a spurious wake; real errors surface as EPOLLERR/HUP
+                    # Count a wake only once a whole input_event arrived; the kernel
+                    # reports real transitions only, so nothing else needs debouncing.
+                    if got >= INPUT_EVENT_SIZE:
+                        woke_from = woke_from or f"{path} [{name}]"
+                if woke_from:
                     last_activity = now
-                    if blanked or dimmed:
+
+                if now >= next_temp:
+                    if not self.temp_guard.check():
+                        return  # shutting down
+                    next_temp = now + temp_ns
+
+                if bl is None:
+                    continue
+                desired = STATE_IDLE if now - last_activity >= self.idle_ns else STATE_ACTIVE
+                if desired != state:
+                    if desired == STATE_IDLE:
+                        log(idle_msg)
+                        go_idle()
+                    else:
                         log(f"Input activity → wake from {woke_from}")
                         bl.on()
-                        blanked = False
-                        dimmed = False
-                        time.sleep(0.05)  # debounce
-
-                idle = now - last_activity
-                if idle >= self.idle_secs:
-                    if self.mode == "off":
-                        if not blanked:
-                            log("Idle exceeded: turning backlight OFF")
-                            bl.off()
-                            blanked = True
-                            dimmed = False
-                    else:
-                        if not dimmed:
-                            log(f"Idle exceeded: DIM backlight to {self.dim_brightness}")
-                            bl.dim(self.dim_brightness)
-                            dimmed = True
-                            blanked = False
-                time.sleep(0.05)
+                    state = desired
         finally:
-            for fd, _, _ in fds:
+            for fd in fds:
                 try: os.close(fd)
                 except Exception: pass
-
-class TempGuardThread(threading.Thread):
+            if ino_fd >= 0: os.close(ino_fd)
+            ep.close()
+            if bl is not None:
+                if state == STATE_IDLE: bl.on()  # don't leave the screen dark after a stop
+                bl.close()
+
+class TempGuard:
+    """CPU overheat guard; GuardLoop calls check() every check_interval_s."""
     def __init__(self, threshold_c, check_interval_s, grace_reads):
-        super().__init__(daemon=True)
         self.thresh = threshold_c
         self.interval = check_interval_s
         self.grace_reads = grace_reads
-        self.stop_flag = threading.Event()
-
-    def run(self):
-        consecutive_hot = 0
-        while not self.stop_flag.is_set():
-            t = get_cpu_temp_c()
-            if t is not None:
+        self.consecutive_hot = 0
+        self.last_logged = None     # temp shown in the last "CPU Temp" line
+        self.was_hot = False
+        self.unreadable_logged = False
+        self.summary = [None, None, 0.0, 0]  # min, max, sum, count since last summary
+        self.next_summary = time.monotonic() + 3600
+
+    def check(self):
+        """Read and act on the temperature once; False once shutdown has started."""
+        t = get_cpu_temp_c()
+        if t is not None:
+            self.unreadable_logged = False
+            hot = t > self.thresh
+            # Only log meaningful changes; a line every interval wears the SD card.
+            if self.last_logged is None or abs(t - self.last_logged) >= 1.0 or hot != self.was_hot:
                 log(f"CPU Temp: {t:.1f}°C")
-                if t > self.thresh:
-                    consecutive_hot += 1
-                    log(f"Above threshold ({self.thresh:.1f}°C): {consecutive_hot}/{self.grace_reads}")
-                    if consecutive_hot >= self.grace_reads:
-                        log("Threshold exceeded persistently. Initiating shutdown.")
-                        # Use systemd to shutdown cleanly
-                        os.system("systemctl poweroff")
-                        return
-                else:
-                    consecutive_hot = 0
+                self.last_logged = t
+            self.was_hot = hot
+            lo, hi, total, n = self.summary
+            self.summary = [t if lo is None else min(lo, t), t if hi is None else max(hi, t), total + t, n + 1]
+            if hot:
+                self.consecutive_hot += 1
+                log(f"Above threshold ({self.thresh:.1f}°C): {self.consecutive_hot}/{self.grace_reads}")
+                if self.consecutive_hot >= self.grace_reads:
+                    log("Threshold exceeded persistently. Initiating shutdown.")
+                    power_off()
+                    return False
             else:
-                log("Could not read CPU temperature.")
-            for _ in range(self.interval * 10):
-                if self.stop_flag.is_set(): return
-                time.sleep(0.1)
+                self.consecutive_hot = 0
+        elif not self.unreadable_logged:
+            log("Could not read CPU temperature.")
+            self.unreadable_logged = True
+        if time.monotonic() >= self.next_summary:
+            lo, hi, total, n = self.summary
+            if n:
+                log(f"CPU Temp last hour: min {lo:.1f}°C / avg {total / n:.1f}°C / max {hi:.1f}°C")
+            self.summary = [None, None, 0.0, 0]
+            self.next_summary += 3600
+        return True
 
 # --------------------------------- Main ------------------------------------
 def parse_args():
@@ -267,30 +509,29 @@ def main():
     global LOG_FILE
     args = parse_args()
     LOG_FILE = args.log_file
+    open_log(LOG_FILE)
 
     log("Starting screen_power_therm_guard…")
 
-    t1 = TouchIdleThread(
+    loop = GuardLoop(
         idle_secs=args.idle_secs,
         mode=args.mode,
         dim_brightness=args.dim_brightness,
         backlight_path=args.backlight,
-        touch_re=args.touch_re,
-    )
-    t2 = TempGuardThread(
-        threshold_c=args.temp_threshold,
-        check_interval_s=args.check_interval,
-        grace_reads=args.grace_reads,
+        temp_guard=TempGuard(
+            threshold_c=args.temp_threshold,
+            check_interval_s=args.check_interval,
+            grace_reads=args.grace_reads,
+        ),
     )
-    t1.start(); t2.start()
 
+    # systemd stops with SIGTERM: unwind like Ctrl-C so run() closes and restores
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     try:
-        while t1.is_alive() and t2.is_alive():
-            time.sleep(1)
+        loop.run()
     except KeyboardInterrupt:
         pass
     finally:
-        t1.stop_flag.set(); t2.stop_flag.set()
         log("Exiting screen_power_therm_guard.")
 
 if __name__ == "__main__":